@@ -1,23 +1,31 @@
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
 
+import yaml
+
+# Prefer the libyaml-backed C loader; fall back to the pure-Python one.
 try:
-    import yaml
-except ImportError as exc:  # pragma: no cover - runtime safeguard
-    raise RuntimeError(
-        "Missing dependency 'PyYAML'. Install with: pip install -r requirements.txt"
-    ) from exc
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DetailPageConfig:
     enabled: bool
     description_selector: Optional[str]
+    concurrency: int = 8
+
 
+# Shared by every site without a detail_page block
+_NO_DETAIL_PAGE = DetailPageConfig(enabled=False, description_selector=None)
 
-@dataclass
+
+@dataclass(slots=True)
 class SiteConfig:
     name: str
     type: str
@@ -50,21 +58,23 @@ class SiteConfig:
     ats_system: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ScheduleConfig:
     days_back: int
     sleep_seconds: float
 
 
-@dataclass
+@dataclass(slots=True)
 class FetcherConfig:
     sleep_seconds: float
     rotate_user_agents: bool
     use_cloudscraper: bool
     timeout: int
+    use_http2: bool = False
+    site_concurrency: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class AppConfig:
     schedule: ScheduleConfig
     fetcher: FetcherConfig
@@ -82,30 +92,65 @@ def _require(config: Dict[str, Any], key: str, context: str) -> Any:
     return config[key]
 
 
+def _clean_list(items: Optional[List[Any]]) -> List[str]:
+    """Stringify and strip each entry once, dropping blanks."""
+    return [text for text in (str(item).strip() for item in items or []) if text]
+
+
 def _load_detail_page(raw: Dict[str, Any]) -> DetailPageConfig:
     if raw is None:
-        return DetailPageConfig(enabled=False, description_selector=None)
+        return _NO_DETAIL_PAGE
     return DetailPageConfig(
         enabled=bool(raw.get("enabled", False)),
         description_selector=raw.get("description_selector"),
+        concurrency=max(1, int(raw.get("concurrency", 8))),
+    )
+
+
+def _load_generic_site(raw: Dict[str, Any], site_type: str) -> SiteConfig:
+    return _build_site(
+        raw,
+        site_type,
+        list_item_selector=_require(raw, "list_item_selector", "site"),
+        title_selector=_require(raw, "title_selector", "site"),
+        url_selector=_require(raw, "url_selector", "site"),
+        start_urls=list(_require(raw, "start_urls", "site")),
     )
 
 
+def _load_api_site(raw: Dict[str, Any], site_type: str) -> SiteConfig:
+    # JobSpy, Workday, and Playwright sites don't scrape list pages, so the
+    # CSS selectors and start URLs are optional
+    return _build_site(
+        raw,
+        site_type,
+        list_item_selector=raw.get("list_item_selector", ""),
+        title_selector=raw.get("title_selector", ""),
+        url_selector=raw.get("url_selector", ""),
+        start_urls=raw.get("start_urls", [""]),
+    )
+
+
+_SITE_LOADERS: Dict[str, Callable[[Dict[str, Any], str], SiteConfig]] = {
+    "jobspy": _load_api_site,
+    "workday": _load_api_site,
+    "playwright": _load_api_site,
+}
+
+
 def _load_site(raw: Dict[str, Any]) -> SiteConfig:
     site_type = raw.get("type", "generic")
+    return _SITE_LOADERS.get(site_type, _load_generic_site)(raw, site_type)
 
-    # For JobSpy, Workday, and Playwright sites, make certain fields optional
-    if site_type in ("jobspy", "workday", "playwright"):
-        list_item_selector = raw.get("list_item_selector", "")
-        title_selector = raw.get("title_selector", "")
-        url_selector = raw.get("url_selector", "")
-        start_urls = raw.get("start_urls", [""])
-    else:
-        list_item_selector = _require(raw, "list_item_selector", "site")
-        title_selector = _require(raw, "title_selector", "site")
-        url_selector = _require(raw, "url_selector", "site")
-        start_urls = list(_require(raw, "start_urls", "site"))
 
+def _build_site(
+    raw: Dict[str, Any],
+    site_type: str,
+    list_item_selector: str,
+    title_selector: str,
+    url_selector: str,
+    start_urls: List[str],
+) -> SiteConfig:
     return SiteConfig(
         name=_require(raw, "name", "site"),
         type=site_type,
@@ -140,8 +185,20 @@ def _load_site(raw: Dict[str, Any]) -> SiteConfig:
 
 
 def load_config(path: str) -> AppConfig:
+    """Load the YAML config at ``path``.
+
+    Parsed configs are cached by (absolute path, mtime, size), so repeated
+    calls on an unchanged file return the same ``AppConfig`` instance.
+    Callers must treat the result as read-only.
+    """
+    stat = os.stat(path)
+    return _load_config_cached(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(path: str, mtime_ns: int, size: int) -> AppConfig:
     with open(path, "r", encoding="utf-8") as handle:
-        raw = yaml.safe_load(handle) or {}
+        raw = yaml.load(handle, Loader=_SafeLoader) or {}
 
     schedule_raw = raw.get("schedule", {})
     schedule = ScheduleConfig(
@@ -155,17 +212,20 @@ def load_config(path: str) -> AppConfig:
         rotate_user_agents=bool(fetcher_raw.get("rotate_user_agents", True)),
         use_cloudscraper=bool(fetcher_raw.get("use_cloudscraper", False)),
         timeout=int(fetcher_raw.get("timeout", 20)),
+        use_http2=bool(fetcher_raw.get("use_http2", False)),
+        site_concurrency=max(1, int(fetcher_raw.get("site_concurrency", 1))),
     )
 
-    include_keywords_raw = raw.get("include_keywords", raw.get("keywords", []))
-    include_keywords = [str(item).strip() for item in include_keywords_raw if str(item).strip()]
-    exclude_keywords = [str(item).strip() for item in raw.get("exclude_keywords", []) if str(item).strip()]
-    job_titles = [str(item).strip() for item in raw.get("job_titles", []) if str(item).strip()]
-    title_must_contain = [str(item).strip() for item in raw.get("title_must_contain", []) if str(item).strip()]
-    title_exclude = [str(item).strip() for item in raw.get("title_exclude", []) if str(item).strip()]
-    sites = [_load_site(item) for item in raw.get("sites", [])]
-    if not sites:
+    include_keywords = _clean_list(raw.get("include_keywords", raw.get("keywords", [])))
+    exclude_keywords = _clean_list(raw.get("exclude_keywords"))
+    job_titles = _clean_list(raw.get("job_titles"))
+    title_must_contain = _clean_list(raw.get("title_must_contain"))
+    title_exclude = _clean_list(raw.get("title_exclude"))
+    raw_sites = raw.get("sites", [])
+    if not raw_sites:
         raise ValueError("Config must include at least one site")
+    # Disabled sites are never run, so don't build (or validate) them
+    sites = [_load_site(item) for item in raw_sites if item.get("enabled", True)]
 
     return AppConfig(
         schedule=schedule,
@@ -2,47 +2,126 @@
 
 from __future__ import annotations
 
+import atexit
+import base64
 import csv
+import hashlib
+import mmap
 import os
 import smtplib
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from email import encoders
 from email.mime.base import MIMEBase
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
+from email.policy import SMTP as SMTP_POLICY
 from pathlib import Path
 from typing import List, Optional
 
 from .models import JobPosting
 
+# Large write buffer so big exports hit the disk in a few syscalls
+_CSV_BUFFER_SIZE = 1 << 20
+
+# Process-wide SMTP session reused across send_email_report calls
+_smtp_lock = threading.Lock()
+_smtp_server: Optional[smtplib.SMTP_SSL] = None
+# Digest of the login the session was opened with; the password itself is not kept
+_smtp_login_digest: Optional[bytes] = None
+
+
+def _csv_row(idx: int, job: JobPosting) -> tuple:
+    """Build one CSV row for a job posting."""
+    date_posted_str = job.date_posted.date().isoformat() if job.date_posted else "N/A"
+    expiration_str = job.expiration_date.date().isoformat() if job.expiration_date else "N/A"
+    return (
+        idx,
+        job.title,
+        job.company,
+        job.url,
+        job.location or "N/A",
+        job.state or "N/A",
+        job.salary or "N/A",
+        date_posted_str,
+        expiration_str,
+    )
+
 
 def _write_jobs_csv(jobs: List[JobPosting], output_path: str) -> str:
     """Write job postings to a CSV file and return the file path."""
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, "w", newline="", encoding="utf-8") as f:
+    with open(output_path, "w", newline="", encoding="utf-8", buffering=_CSV_BUFFER_SIZE) as f:
         writer = csv.writer(f)
         writer.writerow(["#", "Title", "Company", "URL", "Location", "State", "Salary", "Date Posted", "Expiration Date"])
-        for idx, job in enumerate(jobs, 1):
-            date_posted_str = job.date_posted.strftime("%Y-%m-%d") if job.date_posted else "N/A"
-            expiration_str = job.expiration_date.strftime("%Y-%m-%d") if job.expiration_date else "N/A"
-            writer.writerow(
-                [
-                    idx,
-                    job.title,
-                    job.company,
-                    job.url,
-                    job.location or "N/A",
-                    job.state or "N/A",
-                    job.salary or "N/A",
-                    date_posted_str,
-                    expiration_str,
-                ]
-            )
+        writer.writerows(_csv_row(idx, job) for idx, job in enumerate(jobs, 1))
     return output_path
 
 
+def _login_digest(sender: str, password: str) -> bytes:
+    return hashlib.sha256(f"{sender}\0{password}".encode("utf-8")).digest()
+
+
+def _get_smtp_locked(sender: str, password: str) -> smtplib.SMTP_SSL:
+    """Return the shared logged-in SMTP session, reconnecting if it went stale.
+
+    Caller must hold _smtp_lock.
+    """
+    global _smtp_server, _smtp_login_digest
+    login_digest = _login_digest(sender, password)
+    if _smtp_server is not None:
+        if _smtp_login_digest == login_digest:
+            try:
+                _smtp_server.noop()
+                return _smtp_server
+            except smtplib.SMTPException:
+                pass
+        _close_smtp_locked()
+
+    server = smtplib.SMTP_SSL("smtp.gmail.com", 465)
+    server.login(sender, password)
+    _smtp_server = server
+    _smtp_login_digest = login_digest
+    return server
+
+
+def _close_smtp_locked() -> None:
+    global _smtp_server, _smtp_login_digest
+    if _smtp_server is not None:
+        try:
+            _smtp_server.quit()
+        except smtplib.SMTPException:
+            pass
+    _smtp_server = None
+    _smtp_login_digest = None
+
+
+def _close_smtp() -> None:
+    """Close the shared SMTP session (registered to run at exit)."""
+    with _smtp_lock:
+        _close_smtp_locked()
+
+
+atexit.register(_close_smtp)
+
+
+def _send(sender: str, password: str, msg: MIMEMultipart, recipients: List[str]) -> None:
+    """Send an already-built message over the shared SMTP session.
+
+    The lock covers the health check, the send and the retry, so concurrent
+    reports never interleave commands on (or close) a session mid-send.
+    """
+    with _smtp_lock:
+        try:
+            _get_smtp_locked(sender, password).send_message(msg, from_addr=sender, to_addrs=recipients)
+        except smtplib.SMTPServerDisconnected:
+            # Connection dropped between the health check and the send
+            _close_smtp_locked()
+            _get_smtp_locked(sender, password).send_message(msg, from_addr=sender, to_addrs=recipients)
+
+
 def send_email_report(
     unfiltered: List[JobPosting],
     filtered: List[JobPosting],
@@ -91,26 +170,31 @@ def send_email_report(
         )
         return False
 
+    # Single timestamp so filenames and subject line always agree
+    now = datetime.now()
+
     # Prepare output directory and file paths
     output_dir = Path("outputs_csv_format")
-    date_str = datetime.now().strftime("%Y%m%d")
+    date_str = now.strftime("%Y%m%d")
 
     filtered_csv_path = output_dir / f"filtered_jobs_{date_str}.csv"
     unfiltered_csv_path = output_dir / f"unfiltered_jobs_{date_str}.csv"
     super_filtered_csv_path = output_dir / f"super_filtered_jobs_{date_str}.csv"
 
-    # Write CSV files
-    _write_jobs_csv(filtered, str(filtered_csv_path))
-    _write_jobs_csv(unfiltered, str(unfiltered_csv_path))
+    # Write CSV files concurrently (independent files, overlapping disk I/O)
+    csv_tasks = [(filtered, filtered_csv_path), (unfiltered, unfiltered_csv_path)]
     if super_filtered:
-        _write_jobs_csv(super_filtered, str(super_filtered_csv_path))
+        csv_tasks.append((super_filtered, super_filtered_csv_path))
+    with ThreadPoolExecutor(max_workers=len(csv_tasks)) as executor:
+        list(executor.map(lambda task: _write_jobs_csv(task[0], str(task[1])), csv_tasks))
 
     try:
         # Create message with attachments
-        msg = MIMEMultipart("mixed")
+        # SMTP policy: CRLF line endings, so send_message serialises without a rewrite pass
+        msg = MIMEMultipart("mixed", policy=SMTP_POLICY)
         super_count = len(super_filtered) if super_filtered else 0
         msg["Subject"] = (
-            f"Job Report - {datetime.now().strftime('%Y-%m-%d')} - {super_count} super / {len(filtered)} filtered / {len(unfiltered)} total"
+            f"Job Report - {now.strftime('%Y-%m-%d')} - {super_count} super / {len(filtered)} filtered / {len(unfiltered)} total"
         )
         msg["From"] = sender
         msg["To"] = ", ".join(recipients)
@@ -126,19 +210,19 @@ def send_email_report(
         attachments.extend([filtered_csv_path, unfiltered_csv_path])
 
         for path in attachments:
-            with open(path, "rb") as f:
-                part = MIMEBase("application", "octet-stream")
-                part.set_payload(f.read())
-            encoders.encode_base64(part)
+            # Encode straight from the memory-mapped file instead of reading
+            # it into a buffer and letting encoders.encode_base64 copy it again
+            part = MIMEBase("application", "octet-stream")
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                part.set_payload(base64.encodebytes(mapped).decode("ascii"))
+            part["Content-Transfer-Encoding"] = "base64"
             part.add_header(
                 "Content-Disposition", f'attachment; filename="{path.name}"'
             )
             msg.attach(part)
 
-        # Send email via Gmail SMTP
-        with smtplib.SMTP_SSL("smtp.gmail.com", 465) as server:
-            server.login(sender, password)
-            server.sendmail(sender, recipients, msg.as_string())
+        # Send email via Gmail SMTP over the shared process-wide session
+        _send(sender, password, msg, recipients)
 
         print(
             f"✉️  Email report sent successfully to: {', '.join(recipients)}",
@@ -2,8 +2,12 @@ from __future__ import annotations
 
 import random
 import sys
+import threading
 import time
-from typing import Dict, List, Optional
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
 
 import requests
 
@@ -15,12 +19,14 @@ class Fetcher:
         timeout: int = 20,
         sleep_seconds: float = 0.0,
         rotate_user_agents: bool = True,
-        use_cloudscraper: bool = False
+        use_cloudscraper: bool = False,
+        use_http2: bool = False
     ):
         self._rotate_user_agents = rotate_user_agents
         self._use_cloudscraper = use_cloudscraper
+        self._request_errors: Tuple[type, ...] = (requests.RequestException,)
 
-        # Initialize session (cloudscraper or requests)
+        # Initialize session (cloudscraper, httpx over HTTP/2, or requests)
         if use_cloudscraper:
             try:
                 import cloudscraper
@@ -28,6 +34,16 @@ class Fetcher:
             except ImportError:
                 print("Warning: cloudscraper not installed, falling back to requests", file=sys.stderr)
                 self._session = requests.Session()
+        elif use_http2:
+            try:
+                import httpx
+                # Multiplexes requests to the same host over one TLS connection
+                self._session = httpx.Client(http2=True, follow_redirects=True)
+                # InvalidURL is not an HTTPError; requests wraps the same inputs in RequestException
+                self._request_errors = (httpx.HTTPError, httpx.InvalidURL)
+            except ImportError:
+                print("Warning: httpx[http2] not installed, falling back to requests", file=sys.stderr)
+                self._session = requests.Session()
         else:
             self._session = requests.Session()
 
@@ -39,16 +55,20 @@ class Fetcher:
         self._sleep_seconds = sleep_seconds
         self._user_agents = self._get_user_agents()
 
-    def _get_user_agents(self) -> List[str]:
-        """Get list of realistic user agents for rotation"""
-        return [
+        # One lock per host so concurrent batches stay polite per domain
+        self._host_locks: Dict[str, threading.Lock] = defaultdict(threading.Lock)
+        self._host_locks_guard = threading.Lock()
+
+    def _get_user_agents(self) -> Tuple[str, ...]:
+        """Get realistic user agents for rotation"""
+        return (
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
             "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
             "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:121.0) Gecko/20100101 Firefox/121.0",
             "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15",
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36 Edg/120.0.0.0"
-        ]
+        )
 
     def _get_browser_headers(self) -> Dict[str, str]:
         """Get realistic browser headers"""
@@ -66,15 +86,12 @@ class Fetcher:
             "Cache-Control": "max-age=0"
         }
 
-    def _rotate_headers(self) -> None:
-        """Rotate user agent and related headers"""
-        if self._rotate_user_agents and self._user_agents:
-            user_agent = random.choice(self._user_agents)
-            self._session.headers.update({"User-Agent": user_agent})
-
     def get(self, url: str, silent: bool = False, raise_on_error: bool = False) -> str:
         """Fetch URL content.
 
+        When a sleep is configured, requests to the same host are serialized
+        (including the sleep), so concurrent callers stay polite per domain.
+
         Args:
             url: URL to fetch
             silent: If True, suppress error warnings (useful when errors are expected/handled)
@@ -83,14 +100,20 @@ class Fetcher:
         Returns:
             HTML content or empty string on error (unless raise_on_error=True)
         """
+        if self._sleep_seconds <= 0:
+            return self._get(url, silent, raise_on_error)
+        with self._host_lock(url):
+            return self._get(url, silent, raise_on_error)
+
+    def _get(self, url: str, silent: bool, raise_on_error: bool) -> str:
         try:
-            # Rotate user agent if enabled
-            self._rotate_headers()
+            # Rotate user agent per request without mutating shared session headers
+            headers = {"User-Agent": random.choice(self._user_agents)} if self._rotate_user_agents and self._user_agents else None
 
-            response = self._session.get(url, timeout=self._timeout)
+            response = self._session.get(url, timeout=self._timeout, headers=headers)
             response.raise_for_status()
             return response.text
-        except requests.RequestException as exc:
+        except self._request_errors as exc:
             # Only print warning if not in silent mode
             if not silent:
                 print(f"fetch warning: {url} -> {exc}", file=sys.stderr)
@@ -104,3 +127,19 @@ class Fetcher:
                 sleep_time = self._sleep_seconds + random.uniform(-0.5, 0.5)
                 sleep_time = max(0.1, sleep_time)  # Ensure minimum sleep
                 time.sleep(sleep_time)
+
+    def get_many(self, urls: List[str], max_workers: int = 8, silent: bool = False) -> List[str]:
+        """Fetch several URLs concurrently, returning contents in input order.
+
+        get() serializes requests to the same host when a sleep is configured,
+        so parallelism then only spans different hosts.
+        """
+        if not urls:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+            return list(executor.map(lambda url: self.get(url, silent=silent), urls))
+
+    def _host_lock(self, url: str) -> threading.Lock:
+        host = urlsplit(url).netloc
+        with self._host_locks_guard:
+            return self._host_locks[host]
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import re
+import sys
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Iterable, List, Optional, Tuple
 
 try:
@@ -9,6 +11,11 @@ try:
 except ImportError:  # pragma: no cover - fallback only if dependency missing
     date_parser = None
 
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional, keyword scan falls back to regex
+    ahocorasick = None
+
 
 # Relative date pattern - supports "30+ days ago" format
 _RELATIVE_RE = re.compile(r"(\d+)\+?\s*(day|days|hour|hours|minute|minutes|week|weeks|month|months)\s*ago", re.IGNORECASE)
@@ -16,6 +23,15 @@ _RELATIVE_RE = re.compile(r"(\d+)\+?\s*(day|days|hour|hours|minute|minutes|week|
 # Future relative pattern: "in 5 days", "in 2 weeks"
 _FUTURE_RELATIVE_RE = re.compile(r"in\s+(\d+)\s*(day|days|week|weeks|month|months)", re.IGNORECASE)
 
+# One unit of each time word captured by the relative patterns above
+_UNIT_DELTAS = {
+    "minute": timedelta(minutes=1), "minutes": timedelta(minutes=1),
+    "hour": timedelta(hours=1), "hours": timedelta(hours=1),
+    "day": timedelta(days=1), "days": timedelta(days=1),
+    "week": timedelta(weeks=1), "weeks": timedelta(weeks=1),
+    "month": timedelta(days=30), "months": timedelta(days=30),  # Approximate
+}
+
 # Patterns that indicate an EXPIRATION date (not a posted date)
 # These keywords before a date mean it's a deadline/expiration
 # IMPORTANT: More specific patterns (e.g., "posting end date") should come BEFORE
@@ -78,24 +94,46 @@ _DATE_PATTERNS = [
     # Month-Day without year: Jan 15, January 15 (assume current year) - NOT followed by year
     (re.compile(r'(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:t(?:ember)?)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{1,2}(?!\s*,?\s*\d{4})', re.IGNORECASE), 'month_day'),
 ]
+
+# Phrases meaning the job was posted today ("posted today" is covered by "today")
+_POSTED_NOW_PHRASES = ("today", "just now", "just posted", "recently posted", "posted now")
+
+# Cheap pre-check for extract_all_dates: text without a digit, a posted-now
+# phrase or "yesterday" cannot yield any date
+_DATE_HINT_RE = re.compile(
+    r"\d|yesterday|" + "|".join(re.escape(phrase) for phrase in _POSTED_NOW_PHRASES),
+    re.IGNORECASE,
+)
+
+# All date patterns fused into one alternation so the text is scanned once;
+# the named group that matched (m.lastgroup) is the pattern type. Earlier
+# patterns win at the same position, matching the order of _DATE_PATTERNS.
+_COMBINED_DATE_RE = re.compile(
+    "|".join(f"(?P<{name}>{pattern.pattern})" for pattern, name in _DATE_PATTERNS),
+    re.IGNORECASE,
+)
 _HOURLY_PAY_RE = re.compile(r"(an\s+hour|per\s+hour|/\s*hour|\$\d+\.?\d*/\s*hr|\$\d+\.?\d*\s*/\s*hour)", re.IGNORECASE)
 
 # Salary pattern - ONLY matches when $ is directly to the left of the number
 # Examples: $80,000, $120K, $80,000 - $120,000, $150k-$200k
+# Digits are ASCII-only; \s stays Unicode so non-breaking spaces still match
 _SALARY_RE = re.compile(
-    r"\$[\d,]+(?:\.\d{2})?\s*[kK]?"  # Must start with $ followed by number
-    r"(?:\s*[-–]\s*\$[\d,]+(?:\.\d{2})?\s*[kK]?)?",  # Optional range (also requires $)
+    r"\$[0-9,]+(?:\.[0-9]{2})?\s*[kK]?"  # Must start with $ followed by number
+    r"(?:\s*[-\u2013\u2014]\s*\$[0-9,]+(?:\.[0-9]{2})?\s*[kK]?)?",  # Optional range (also requires $)
     re.IGNORECASE
 )
 
 # US State abbreviations for extraction
-_US_STATES = {
+_US_STATES = frozenset(sys.intern(abbrev) for abbrev in (
     "AL", "AK", "AZ", "AR", "CA", "CO", "CT", "DE", "FL", "GA",
     "HI", "ID", "IL", "IN", "IA", "KS", "KY", "LA", "ME", "MD",
     "MA", "MI", "MN", "MS", "MO", "MT", "NE", "NV", "NH", "NJ",
     "NM", "NY", "NC", "ND", "OH", "OK", "OR", "PA", "RI", "SC",
     "SD", "TN", "TX", "UT", "VT", "VA", "WA", "WV", "WI", "WY", "DC"
-}
+))
+
+# Membership check and interned return value in one lookup
+_INTERNED_STATES = {abbrev: abbrev for abbrev in _US_STATES}
 
 _STATE_NAMES = {
     "alabama": "AL", "alaska": "AK", "arizona": "AZ", "arkansas": "AR",
@@ -113,70 +151,186 @@ _STATE_NAMES = {
     "wisconsin": "WI", "wyoming": "WY", "district of columbia": "DC"
 }
 
+# Last state code delimited by whitespace/commas; the greedy ".*" prefix makes
+# the engine scan from the end, so no token list has to be built
+_STATE_CODE_RE = re.compile(
+    r".*(?<![^\s,])(" + "|".join(sorted(_US_STATES)) + r")(?![^\s,])",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Full state names as plain substrings. When several occur, the first in dict
+# order wins (as the original loop did), except that "west virginia" is ranked
+# just ahead of the "virginia" it contains.
+_STATE_NAME_ORDER = [name for name in _STATE_NAMES if name != "west virginia"]
+_STATE_NAME_ORDER.insert(_STATE_NAME_ORDER.index("virginia"), "west virginia")
+_STATE_NAME_PRIORITY = {name: index for index, name in enumerate(_STATE_NAME_ORDER)}
+# Lookahead so findall reports overlapping names ("virginia" inside "west virginia")
+_STATE_NAME_RE = re.compile(
+    "(?=(" + "|".join(re.escape(name) for name in _STATE_NAME_ORDER) + "))"
+)
+
+
+# Keyword tuples at least this long are matched in one pass (Aho-Corasick
+# automaton if pyahocorasick is installed, else one compiled alternation)
+# instead of one substring scan per keyword
+_KEYWORD_REGEX_MIN = 8
+
+
+def normalize_keywords(keywords: Iterable[str]) -> Tuple[str, ...]:
+    """Strip and lowercase keywords once, returning an immutable tuple.
+
+    Callers should normalize at startup and pass the tuple through the pipeline.
+    """
+    return tuple(item.strip().lower() for item in keywords if item and item.strip())
+
+
+@lru_cache(maxsize=32)
+def _cached_keyword_automaton(keywords: Tuple[str, ...]):
+    return _keyword_automaton(keywords)
+
+
+@lru_cache(maxsize=32)
+def _keyword_regex(keywords: Tuple[str, ...]) -> re.Pattern:
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+
+def matches_any_lower(haystack_lower: str, keywords: Iterable[str]) -> bool:
+    """Return True if any (already lowercased) keyword occurs in the lowercased haystack.
+
+    Lets callers lowercase a text once and test it against several keyword lists.
+    """
+    if isinstance(keywords, tuple) and len(keywords) >= _KEYWORD_REGEX_MIN:
+        if ahocorasick is not None:
+            return next(_cached_keyword_automaton(keywords).iter(haystack_lower), None) is not None
+        return _keyword_regex(keywords).search(haystack_lower) is not None
+    return any(keyword in haystack_lower for keyword in keywords)
+
+
+def count_matches_lower(haystacks_lower: Iterable[str], keywords: Iterable[str]) -> int:
+    """Count the (already lowercased) keywords found in any of the lowercased haystacks.
+
+    Lets callers count over several fields without joining them into one string.
+    """
+    haystacks_lower = tuple(haystacks_lower)
+    if ahocorasick is not None and isinstance(keywords, tuple) and len(keywords) >= _KEYWORD_REGEX_MIN:
+        # One pass per haystack collects every keyword present (overlaps included);
+        # duplicate keywords still count once each, as in the substring loop below
+        automaton = _cached_keyword_automaton(keywords)
+        found = {keyword for haystack in haystacks_lower for _, keyword in automaton.iter(haystack)}
+        return sum(1 for keyword in keywords if keyword in found)
+    return sum(1 for keyword in keywords if any(keyword in haystack for haystack in haystacks_lower))
+
+
+@lru_cache(maxsize=128)
+def _normalized_keywords(keywords: Tuple[str, ...]) -> Tuple[str, ...]:
+    return normalize_keywords(keywords)
 
-def normalize_keywords(keywords: Iterable[str]) -> List[str]:
-    return [item.strip().lower() for item in keywords if item and item.strip()]
 
+def _as_normalized(keywords: Iterable[str]) -> Tuple[str, ...]:
+    return _normalized_keywords(keywords if isinstance(keywords, tuple) else tuple(keywords))
 
-def include_keyword_match(text: str, keywords: Iterable[str]) -> bool:
+
+def include_keyword_match(text: str, keywords: Iterable[str], haystack_lower: Optional[str] = None) -> bool:
     if not keywords:
         return True
-    haystack = text.lower()
-    return any(keyword in haystack for keyword in keywords)
+    if haystack_lower is None:
+        haystack_lower = text.lower()
+    return matches_any_lower(haystack_lower, _as_normalized(keywords))
+
 
+def count_keyword_matches(text: str, keywords: Iterable[str], haystack_lower: Optional[str] = None) -> int:
+    """Count how many keywords match in the text.
 
-def count_keyword_matches(text: str, keywords: Iterable[str]) -> int:
-    """Count how many keywords match in the text."""
+    Pass haystack_lower when the caller already holds the lowercased text.
+    """
     if not keywords:
         return 0
-    haystack = text.lower()
-    return sum(1 for keyword in keywords if keyword in haystack)
+    if haystack_lower is None:
+        haystack_lower = text.lower()
+    return count_matches_lower((haystack_lower,), _as_normalized(keywords))
 
 
-def exclude_keyword_match(text: str, keywords: Iterable[str]) -> bool:
+def exclude_keyword_match(text: str, keywords: Iterable[str], haystack_lower: Optional[str] = None) -> bool:
     if not keywords:
         return True
-    haystack = text.lower()
-    return not any(keyword in haystack for keyword in keywords)
+    if haystack_lower is None:
+        haystack_lower = text.lower()
+    return not matches_any_lower(haystack_lower, _as_normalized(keywords))
+
+
+@lru_cache(maxsize=4096)
+def _parse_dateutil_cached(date_str: str) -> Optional[datetime]:
+    """Parse an absolute date string with dateutil, defaulting naive results to UTC.
+
+    Scraped feeds repeat the same date strings constantly, so results are memoized.
+    Returns None if the string cannot be parsed (or dateutil is unavailable).
+    """
+    if date_parser is None:
+        return None
+    try:
+        parsed = date_parser.parse(date_str)
+    except (ValueError, OverflowError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+_US_DATE_SEP_RE = re.compile(r"[/-]")
+
+
+def _parse_us_date(date_str: str) -> datetime:
+    month, day, year = _US_DATE_SEP_RE.split(date_str)
+    return datetime(int(year), int(month), int(day))
+
+
+# Pattern types whose layout is fixed by the regex, so dateutil's format
+# inference can be skipped
+_FAST_DATE_PARSERS = {
+    'iso': datetime.fromisoformat,
+    'us': _parse_us_date,
+}
+
+
+def _parse_known_format(pattern_type: str, date_str: str) -> Optional[datetime]:
+    """Parse a date_str matched by the given _DATE_PATTERNS type, defaulting to UTC.
+
+    Uses a direct constructor for fixed layouts and falls back to dateutil
+    otherwise, or when the fast path rejects the string (e.g. day-first "15/01/2024").
+    """
+    fast_parser = _FAST_DATE_PARSERS.get(pattern_type)
+    if fast_parser is not None:
+        try:
+            parsed = fast_parser(date_str)
+        except ValueError:
+            pass
+        else:
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=timezone.utc)
+            return parsed
+    return _parse_dateutil_cached(date_str)
 
 
 def parse_posted_date(raw: str, now: Optional[datetime] = None) -> Optional[datetime]:
     if not raw:
         return None
     raw = raw.strip()
+    raw_lower = raw.lower()
     now = now or datetime.now(timezone.utc)
 
-    match = _RELATIVE_RE.search(raw)
+    # Cheap substring check before running the relative-date regex
+    match = _RELATIVE_RE.search(raw) if "ago" in raw_lower else None
     if match:
         value = int(match.group(1))
-        unit = match.group(2).lower()
-        if unit.startswith("day"):
-            return now - timedelta(days=value)
-        if unit.startswith("hour"):
-            return now - timedelta(hours=value)
-        if unit.startswith("minute"):
-            return now - timedelta(minutes=value)
-        if unit.startswith("week"):
-            return now - timedelta(weeks=value)
-        if unit.startswith("month"):
-            return now - timedelta(days=value * 30)  # Approximate
-
-    if raw.lower() in {"today", "just now"}:
+        return now - value * _UNIT_DELTAS[match.group(2).lower()]
+
+    if raw_lower in {"today", "just now"}:
         return now
 
-    if raw.lower() == "yesterday":
+    if raw_lower == "yesterday":
         return now - timedelta(days=1)
 
-    if date_parser:
-        try:
-            parsed = date_parser.parse(raw)
-            if parsed.tzinfo is None:
-                parsed = parsed.replace(tzinfo=timezone.utc)
-            return parsed
-        except (ValueError, OverflowError):
-            return None
-
-    return None
+    return _parse_dateutil_cached(raw)
 
 
 def classify_date(dt: datetime, now: datetime) -> str:
@@ -216,30 +370,68 @@ def _validate_date_sanity_filters(dt: datetime, now: datetime, max_age_days: int
     return dt
 
 
-def _find_closest_keyword(text: str, match_start: int, keywords: List[str], lookback: int = 50) -> Tuple[Optional[str], int]:
+def _keyword_finder(keywords: List[str]) -> re.Pattern:
+    """Compile keywords into one zero-width alternation that reports every start position.
+
+    The lookahead lets overlapping keywords ("posting end date" / "end date") all
+    be seen, and longest-first ordering picks the longest keyword at each start.
+    """
+    alternation = "|".join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True))
+    return re.compile(f"(?=({alternation}))")
+
+
+def _keyword_automaton(keywords: Iterable[str]):
+    """Build an Aho-Corasick automaton over keywords, or None without pyahocorasick."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for kw in keywords:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
+
+
+_EXPIRATION_KEYWORD_RE = _keyword_finder(_EXPIRATION_KEYWORDS)
+_POSTED_KEYWORD_RE = _keyword_finder(_POSTED_KEYWORDS)
+_EXPIRATION_KEYWORD_AC = _keyword_automaton(_EXPIRATION_KEYWORDS)
+_POSTED_KEYWORD_AC = _keyword_automaton(_POSTED_KEYWORDS)
+
+
+def _find_closest_keyword(
+    text_lower: str,
+    match_start: int,
+    keyword_re: re.Pattern,
+    automaton=None,
+    lookback: int = 50,
+) -> Tuple[Optional[str], int]:
     """Find the closest keyword before the match position within lookback chars.
 
+    text_lower is the full text, lowercased once by the caller.
+
     Returns:
         Tuple of (keyword found or None, distance from match)
         Distance is 0 if no keyword found.
     """
     start_pos = max(0, match_start - lookback)
-    context = text[start_pos:match_start].lower()
+    context = text_lower[start_pos:match_start]
 
     closest_keyword = None
-    closest_distance = lookback + 1  # Start with distance larger than lookback
+    closest_end = -1
 
-    for kw in keywords:
-        # Find the last occurrence of this keyword in the context (closest to the date)
-        idx = context.rfind(kw)
-        if idx != -1:
-            # Distance from end of keyword to end of context (where date starts)
-            distance = len(context) - idx - len(kw)
-            if distance < closest_distance:
-                closest_distance = distance
+    # One scan of the context; the keyword ending last is closest to the date
+    if automaton is not None:
+        for end_idx, kw in automaton.iter(context):
+            if end_idx >= closest_end:
+                closest_end = end_idx + 1
                 closest_keyword = kw
+    else:
+        for match in keyword_re.finditer(context):
+            end = match.end(1)
+            if end > closest_end:
+                closest_end = end
+                closest_keyword = match.group(1)
 
-    return (closest_keyword, closest_distance if closest_keyword else 0)
+    return (closest_keyword, len(context) - closest_end if closest_keyword else 0)
 
 
 def extract_all_dates(text: str, now: Optional[datetime] = None, max_age_days: int = 365) -> Tuple[Optional[datetime], Optional[datetime]]:
@@ -261,6 +453,10 @@ def extract_all_dates(text: str, now: Optional[datetime] = None, max_age_days: i
     if not text:
         return (None, None)
 
+    # Every date source below needs a digit or one of these words
+    if not _DATE_HINT_RE.search(text):
+        return (None, None)
+
     now = now or datetime.now(timezone.utc)
 
     # Store dates with their classification
@@ -268,16 +464,20 @@ def extract_all_dates(text: str, now: Optional[datetime] = None, max_age_days: i
     classified_dates: List[Tuple[datetime, str]] = []
 
     text_lower = text.lower()
+    # A few non-ASCII characters change length when lowered; keyword lookups
+    # slice text_lower at offsets taken from text, so keep them aligned
+    if len(text_lower) != len(text):
+        text_lower = "".join(ch if len(ch.lower()) != 1 else ch.lower() for ch in text)
 
     # Try relative patterns first (these are always posted dates)
     relative_match = _RELATIVE_RE.search(text)
     if relative_match:
-        parsed = parse_posted_date(relative_match.group(0), now)
-        if parsed:
-            classified_dates.append((parsed, 'posted'))
+        # Already matched, so do the arithmetic here rather than re-parse the substring
+        value = int(relative_match.group(1))
+        classified_dates.append((now - value * _UNIT_DELTAS[relative_match.group(2).lower()], 'posted'))
 
     # Check for today/yesterday and "just posted" variants (these are posted dates)
-    if any(x in text_lower for x in ["today", "just now", "just posted", "recently posted", "posted now", "posted today"]):
+    if any(x in text_lower for x in _POSTED_NOW_PHRASES):
         classified_dates.append((now, 'posted'))
     if "yesterday" in text_lower:
         classified_dates.append((now - timedelta(days=1), 'posted'))
@@ -286,109 +486,80 @@ def extract_all_dates(text: str, now: Optional[datetime] = None, max_age_days: i
     future_match = _FUTURE_RELATIVE_RE.search(text)
     if future_match:
         value = int(future_match.group(1))
-        unit = future_match.group(2).lower()
-        if unit.startswith("day"):
-            classified_dates.append((now + timedelta(days=value), 'expiration'))
-        elif unit.startswith("week"):
-            classified_dates.append((now + timedelta(weeks=value), 'expiration'))
-        elif unit.startswith("month"):
-            classified_dates.append((now + timedelta(days=value * 30), 'expiration'))
-
-    # Try all date patterns and check context for classification
-    for pattern, pattern_type in _DATE_PATTERNS:
-        for match in pattern.finditer(text):
-            date_str = match.group(0)
-            match_start = match.start()
-            parsed = None
-
-            # Handle month_day pattern (no year) - add current year
-            if pattern_type == 'month_day':
-                date_str_with_year = f"{date_str}, {now.year}"
-                if date_parser:
-                    try:
-                        parsed = date_parser.parse(date_str_with_year)
-                        if parsed.tzinfo is None:
-                            parsed = parsed.replace(tzinfo=timezone.utc)
-                        # If the date is in the future by more than a week, assume last year
-                        if parsed > now + timedelta(days=7):
-                            parsed = parsed.replace(year=now.year - 1)
-                    except (ValueError, OverflowError):
-                        continue
-                else:
-                    continue  # Can't parse without dateutil
-            # Handle ordinal pattern (remove ordinal suffix for parsing)
-            elif pattern_type == 'ordinal':
-                # Remove ordinal suffix: 15th -> 15, 3rd -> 3
-                clean_date_str = re.sub(r'(\d+)(?:st|nd|rd|th)', r'\1', date_str)
-                if date_parser:
-                    try:
-                        parsed = date_parser.parse(clean_date_str)
-                        if parsed.tzinfo is None:
-                            parsed = parsed.replace(tzinfo=timezone.utc)
-                    except (ValueError, OverflowError):
-                        continue
-                else:
-                    continue
-            elif date_parser:
+        classified_dates.append((now + value * _UNIT_DELTAS[future_match.group(2).lower()], 'expiration'))
+
+    # Scan once for every date pattern and check context for classification
+    month_day_cutoff = now + timedelta(days=7)
+    for match in _COMBINED_DATE_RE.finditer(text):
+        pattern_type = match.lastgroup
+        date_str = match.group(0)
+        match_start = match.start()
+        parsed = None
+
+        # Handle month_day pattern (no year) - add current year
+        if pattern_type == 'month_day':
+            date_str_with_year = f"{date_str}, {now.year}"
+            parsed = _parse_dateutil_cached(date_str_with_year)
+            if parsed is None:
+                continue  # Unparseable, or no dateutil
+            # If the date is in the future by more than a week, assume last year
+            if parsed > month_day_cutoff:
                 try:
-                    parsed = date_parser.parse(date_str)
-                    if parsed.tzinfo is None:
-                        parsed = parsed.replace(tzinfo=timezone.utc)
-                except (ValueError, OverflowError):
-                    continue
-            else:
-                # Fallback parsing for common formats
-                try:
-                    if pattern_type == 'iso':
-                        if 'T' in date_str:
-                            parsed = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                        else:
-                            parsed = datetime.strptime(date_str, '%Y-%m-%d').replace(tzinfo=timezone.utc)
-                except (ValueError, OverflowError):
+                    parsed = parsed.replace(year=now.year - 1)
+                except ValueError:
                     continue
+        # Handle ordinal pattern (remove ordinal suffix for parsing)
+        elif pattern_type == 'ordinal':
+            # Remove ordinal suffix: 15th -> 15, 3rd -> 3. The pattern only allows it
+            # directly after the leading 1-2 digit day, so slice it out
+            day_len = 2 if date_str[1].isdigit() else 1
+            clean_date_str = date_str[:day_len] + date_str[day_len + 2:]
+            parsed = _parse_dateutil_cached(clean_date_str)
+            if parsed is None:
+                continue
+        else:
+            parsed = _parse_known_format(pattern_type, date_str)
+            if parsed is None:
+                continue
 
-            if parsed:
-                # Check context to classify the date - find the CLOSEST keyword
-                exp_keyword, exp_distance = _find_closest_keyword(text, match_start, _EXPIRATION_KEYWORDS)
-                posted_keyword, posted_distance = _find_closest_keyword(text, match_start, _POSTED_KEYWORDS)
-
-                if exp_keyword and posted_keyword:
-                    # Both found - use the one that's closest to the date
-                    if exp_distance < posted_distance:
-                        classified_dates.append((parsed, 'expiration'))
-                    else:
-                        classified_dates.append((parsed, 'posted'))
-                elif exp_keyword:
-                    # Only expiration keyword found
+        if parsed:
+            # Check context to classify the date - find the CLOSEST keyword
+            exp_keyword, exp_distance = _find_closest_keyword(text_lower, match_start, _EXPIRATION_KEYWORD_RE, _EXPIRATION_KEYWORD_AC)
+            posted_keyword, posted_distance = _find_closest_keyword(text_lower, match_start, _POSTED_KEYWORD_RE, _POSTED_KEYWORD_AC)
+
+            if exp_keyword and posted_keyword:
+                # Both found - use the one that's closest to the date
+                if exp_distance < posted_distance:
                     classified_dates.append((parsed, 'expiration'))
-                elif posted_keyword:
-                    # Only posted keyword found
-                    classified_dates.append((parsed, 'posted'))
                 else:
-                    # No keyword context, classify later by date
-                    classified_dates.append((parsed, 'unknown'))
+                    classified_dates.append((parsed, 'posted'))
+            elif exp_keyword:
+                # Only expiration keyword found
+                classified_dates.append((parsed, 'expiration'))
+            elif posted_keyword:
+                # Only posted keyword found
+                classified_dates.append((parsed, 'posted'))
+            else:
+                # No keyword context, classify later by date
+                classified_dates.append((parsed, 'unknown'))
 
     # Final classification
     date_posted: Optional[datetime] = None
     expiration_date: Optional[datetime] = None
 
+    # Same threshold as classify_date, computed once for all dates
+    expiration_threshold = now + timedelta(days=1)
+
     for dt, classification in classified_dates:
-        # If explicitly classified by keyword, use that
+        # Unknown classification - use time-based heuristic; keyword-based ones stand
+        if classification == 'unknown':
+            classification = 'expiration' if dt > expiration_threshold else 'posted'
+
         if classification == 'expiration':
             if expiration_date is None or dt < expiration_date:
                 expiration_date = dt
-        elif classification == 'posted':
-            if date_posted is None or dt > date_posted:
-                date_posted = dt
-        else:
-            # Unknown classification - use time-based heuristic
-            time_classification = classify_date(dt, now)
-            if time_classification == 'expiration':
-                if expiration_date is None or dt < expiration_date:
-                    expiration_date = dt
-            else:
-                if date_posted is None or dt > date_posted:
-                    date_posted = dt
+        elif date_posted is None or dt > date_posted:
+            date_posted = dt
 
     # Validate date sanity before returning
     if date_posted:
@@ -421,21 +592,18 @@ def extract_state(location: Optional[str]) -> Optional[str]:
     if not location:
         return None
 
-    location = location.strip()
-
     # Try to find state abbreviation (e.g., "Boston, MA" or "MA")
     # Look for 2-letter state code, typically after comma or at end
-    parts = [p.strip() for p in location.replace(",", " ").split()]
-    for part in reversed(parts):  # Check from end first
-        upper_part = part.upper()
-        if upper_part in _US_STATES:
-            return upper_part
+    match = _STATE_CODE_RE.match(location)
+    if match:
+        abbrev = _INTERNED_STATES.get(match.group(1).upper())
+        if abbrev is not None:
+            return abbrev
 
     # Try to match full state names
-    location_lower = location.lower()
-    for state_name, abbrev in _STATE_NAMES.items():
-        if state_name in location_lower:
-            return abbrev
+    state_names = _STATE_NAME_RE.findall(location.lower())
+    if state_names:
+        return _STATE_NAMES[min(state_names, key=_STATE_NAME_PRIORITY.__getitem__)]
 
     return None
 
@@ -475,3 +643,16 @@ def filter_by_date(date_posted: Optional[datetime], days_back: int, now: Optiona
     now = now or datetime.now(timezone.utc)
     cutoff = now - timedelta(days=days_back)
     return date_posted >= cutoff
+
+
+def filter_jobs_by_date(jobs: Iterable, days_back: int, now: Optional[datetime] = None, allow_no_date: bool = True) -> List:
+    """Batch form of filter_by_date: keep jobs whose date_posted is within days_back.
+
+    The clock is read and the cutoff computed once for the whole batch.
+    """
+    now = now or datetime.now(timezone.utc)
+    cutoff = now - timedelta(days=days_back)
+    return [
+        job for job in jobs
+        if (allow_no_date if job.date_posted is None else job.date_posted >= cutoff)
+    ]
@@ -1,9 +1,82 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import List, Set, Optional
 
 
+# Match patterns like "Boston, MA" or "New York, NY, USA" (run on upper-cased text)
+_STATE_ABBREV_RE = re.compile(r'[,\s]\s*([A-Z]{2})(?:[,\s]|$)')
+
+# Common US state abbreviations
+_US_STATES = frozenset({
+    'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA',
+    'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD',
+    'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ',
+    'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC',
+    'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY',
+    'DC'  # Washington DC
+})
+
+# State name to abbreviation mapping for full state names
+_STATE_NAME_TO_ABBREV = {
+    'alabama': 'AL', 'alaska': 'AK', 'arizona': 'AZ', 'arkansas': 'AR',
+    'california': 'CA', 'colorado': 'CO', 'connecticut': 'CT', 'delaware': 'DE',
+    'florida': 'FL', 'georgia': 'GA', 'hawaii': 'HI', 'idaho': 'ID',
+    'illinois': 'IL', 'indiana': 'IN', 'iowa': 'IA', 'kansas': 'KS',
+    'kentucky': 'KY', 'louisiana': 'LA', 'maine': 'ME', 'maryland': 'MD',
+    'massachusetts': 'MA', 'michigan': 'MI', 'minnesota': 'MN', 'mississippi': 'MS',
+    'missouri': 'MO', 'montana': 'MT', 'nebraska': 'NE', 'nevada': 'NV',
+    'new hampshire': 'NH', 'new jersey': 'NJ', 'new mexico': 'NM', 'new york': 'NY',
+    'north carolina': 'NC', 'north dakota': 'ND', 'ohio': 'OH', 'oklahoma': 'OK',
+    'oregon': 'OR', 'pennsylvania': 'PA', 'rhode island': 'RI', 'south carolina': 'SC',
+    'south dakota': 'SD', 'tennessee': 'TN', 'texas': 'TX', 'utah': 'UT',
+    'vermont': 'VT', 'virginia': 'VA', 'washington': 'WA', 'west virginia': 'WV',
+    'wisconsin': 'WI', 'wyoming': 'WY', 'district of columbia': 'DC'
+}
+
+# All state names in one word-bounded alternation. The lookahead reports every
+# start position (overlaps included) in a single scan; no name is a prefix of
+# another, so each position yields at most one name. When several names match,
+# the one earliest in _STATE_NAME_TO_ABBREV wins, as with the old per-name loop,
+# except that 'west virginia' is ranked just ahead of the 'virginia' it contains
+# (same ordering as filters.extract_state).
+_STATE_NAME_ORDER = [name for name in _STATE_NAME_TO_ABBREV if name != 'west virginia']
+_STATE_NAME_ORDER.insert(_STATE_NAME_ORDER.index('virginia'), 'west virginia')
+_STATE_NAME_RE = re.compile(
+    r'\b(?=(' + '|'.join(re.escape(name) for name in _STATE_NAME_ORDER) + r')\b)'
+)
+_STATE_NAME_PRIORITY = {name: index for index, name in enumerate(_STATE_NAME_ORDER)}
+
+# Major cities that clearly indicate states
+_CITY_TO_STATE = {
+    'boston': 'MA', 'cambridge': 'MA', 'worcester': 'MA', 'springfield': 'MA',
+    'new york': 'NY', 'nyc': 'NY', 'brooklyn': 'NY', 'manhattan': 'NY', 'albany': 'NY',
+    'philadelphia': 'PA', 'pittsburgh': 'PA', 'harrisburg': 'PA',
+    'newark': 'NJ', 'jersey city': 'NJ', 'trenton': 'NJ', 'princeton': 'NJ',
+    'san francisco': 'CA', 'san diego': 'CA', 'los angeles': 'CA', 'south san francisco': 'CA',
+    'san jose': 'CA', 'palo alto': 'CA', 'berkeley': 'CA', 'oakland': 'CA', 'la jolla': 'CA'
+}
+
+# Plain substring match (no word boundaries), same single-scan scheme as
+# _STATE_NAME_RE with priority by position in _CITY_TO_STATE
+_CITY_RE = re.compile('(?=(' + '|'.join(re.escape(city) for city in _CITY_TO_STATE) + '))')
+_CITY_PRIORITY = {city: index for index, city in enumerate(_CITY_TO_STATE)}
+
+# Location patterns in job descriptions
+_DESC_LOCATION_RES = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'Location[:\s]+([^,\n]+(?:,[^,\n]+)*)',
+    r'Based in[:\s]+([^,\n]+(?:,[^,\n]+)*)',
+    r'Office[:\s]+([^,\n]+(?:,[^,\n]+)*)',
+))
+
+_REMOTE_TERMS_RE = re.compile(r'remote|work from home|telecommute', re.IGNORECASE)
+
+_US_MENTION_RE = re.compile(r'\b(US|USA|United States)\b', re.IGNORECASE)
+
+
+# Location strings repeat heavily across a scrape ("New York, NY", "Remote")
+@lru_cache(maxsize=4096)
 def extract_us_state_from_location(location: str) -> Optional[str]:
     """
     Extract US state abbreviation from location string.
@@ -17,66 +90,26 @@ def extract_us_state_from_location(location: str) -> Optional[str]:
     if not location:
         return None
 
-    # Common US state abbreviations
-    us_states = {
-        'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA',
-        'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD',
-        'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ',
-        'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC',
-        'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY',
-        'DC'  # Washington DC
-    }
-
-    # State name to abbreviation mapping for full state names
-    state_name_to_abbrev = {
-        'alabama': 'AL', 'alaska': 'AK', 'arizona': 'AZ', 'arkansas': 'AR',
-        'california': 'CA', 'colorado': 'CO', 'connecticut': 'CT', 'delaware': 'DE',
-        'florida': 'FL', 'georgia': 'GA', 'hawaii': 'HI', 'idaho': 'ID',
-        'illinois': 'IL', 'indiana': 'IN', 'iowa': 'IA', 'kansas': 'KS',
-        'kentucky': 'KY', 'louisiana': 'LA', 'maine': 'ME', 'maryland': 'MD',
-        'massachusetts': 'MA', 'michigan': 'MI', 'minnesota': 'MN', 'mississippi': 'MS',
-        'missouri': 'MO', 'montana': 'MT', 'nebraska': 'NE', 'nevada': 'NV',
-        'new hampshire': 'NH', 'new jersey': 'NJ', 'new mexico': 'NM', 'new york': 'NY',
-        'north carolina': 'NC', 'north dakota': 'ND', 'ohio': 'OH', 'oklahoma': 'OK',
-        'oregon': 'OR', 'pennsylvania': 'PA', 'rhode island': 'RI', 'south carolina': 'SC',
-        'south dakota': 'SD', 'tennessee': 'TN', 'texas': 'TX', 'utah': 'UT',
-        'vermont': 'VT', 'virginia': 'VA', 'washington': 'WA', 'west virginia': 'WV',
-        'wisconsin': 'WI', 'wyoming': 'WY', 'district of columbia': 'DC'
-    }
-
     location_clean = location.strip().upper()
 
     # Pattern 1: Look for state abbreviations (2 letters)
     # Match patterns like "Boston, MA" or "New York, NY, USA"
-    state_abbrev_pattern = r'[,\s]\s*([A-Z]{2})(?:[,\s]|$)'
-    match = re.search(state_abbrev_pattern, location_clean)
+    match = _STATE_ABBREV_RE.search(location_clean)
     if match:
         potential_state = match.group(1)
-        if potential_state in us_states:
+        if potential_state in _US_STATES:
             return potential_state
 
     # Pattern 2: Look for full state names
     location_lower = location.lower()
-    for state_name, abbrev in state_name_to_abbrev.items():
-        if state_name in location_lower:
-            # Make sure it's a word boundary match to avoid partial matches
-            pattern = r'\b' + re.escape(state_name) + r'\b'
-            if re.search(pattern, location_lower):
-                return abbrev
+    state_names = _STATE_NAME_RE.findall(location_lower)
+    if state_names:
+        return _STATE_NAME_TO_ABBREV[min(state_names, key=_STATE_NAME_PRIORITY.__getitem__)]
 
     # Pattern 3: Special cases for major cities that clearly indicate states
-    city_to_state = {
-        'boston': 'MA', 'cambridge': 'MA', 'worcester': 'MA', 'springfield': 'MA',
-        'new york': 'NY', 'nyc': 'NY', 'brooklyn': 'NY', 'manhattan': 'NY', 'albany': 'NY',
-        'philadelphia': 'PA', 'pittsburgh': 'PA', 'harrisburg': 'PA',
-        'newark': 'NJ', 'jersey city': 'NJ', 'trenton': 'NJ', 'princeton': 'NJ',
-        'san francisco': 'CA', 'san diego': 'CA', 'los angeles': 'CA', 'south san francisco': 'CA',
-        'san jose': 'CA', 'palo alto': 'CA', 'berkeley': 'CA', 'oakland': 'CA', 'la jolla': 'CA'
-    }
-
-    for city, state in city_to_state.items():
-        if city in location_lower:
-            return state
+    cities = _CITY_RE.findall(location_lower)
+    if cities:
+        return _CITY_TO_STATE[min(cities, key=_CITY_PRIORITY.__getitem__)]
 
     return None
 
@@ -120,23 +153,16 @@ def filter_jobs_by_location(jobs: List, target_states: Set[str]) -> List:
         # Check description for location info
         if hasattr(job, 'description') and job.description:
             # Look for location patterns in description
-            location_patterns = [
-                r'Location[:\s]+([^,\n]+(?:,[^,\n]+)*)',
-                r'Based in[:\s]+([^,\n]+(?:,[^,\n]+)*)',
-                r'Office[:\s]+([^,\n]+(?:,[^,\n]+)*)',
-            ]
-
-            for pattern in location_patterns:
-                matches = re.findall(pattern, job.description, re.IGNORECASE)
-                location_sources.extend(matches)
+            for pattern in _DESC_LOCATION_RES:
+                location_sources.extend(pattern.findall(job.description))
 
         # If no specific location found, check if it's remote
         # Remote jobs are acceptable if they specify US states
         if not location_sources:
             if hasattr(job, 'description') and job.description:
-                if any(term in job.description.lower() for term in ['remote', 'work from home', 'telecommute']):
+                if _REMOTE_TERMS_RE.search(job.description):
                     # For remote jobs, be more permissive but still check if US states are mentioned
-                    us_mentions = re.findall(r'\b(US|USA|United States)\b', job.description, re.IGNORECASE)
+                    us_mentions = _US_MENTION_RE.findall(job.description)
                     if us_mentions:
                         filtered_jobs.append(job)
                         continue
@@ -1,43 +1,118 @@
 from __future__ import annotations
 
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
+import soupsieve
+from bs4 import BeautifulSoup, Tag
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # pragma: no cover - optional, BeautifulSoup is used instead
+    LexborHTMLParser = None
 
-def _select_first_text(node, selector: Optional[str]) -> str:
-    if not selector:
-        return ""
-    target = node.select_one(selector)
+try:
+    import lxml  # noqa: F401
+    _BS4_FEATURES = "lxml"  # libxml2-backed tree builder
+except ImportError:  # pragma: no cover - optional, pure-Python parser fallback
+    _BS4_FEATURES = "html.parser"
+
+# BeautifulSoup's get_text() leaves out script/style contents; mirror that
+_NON_TEXT_TAGS = frozenset({"script", "style"})
+
+
+def _lexbor_text(target) -> str:
+    if target.tag in _NON_TEXT_TAGS:
+        return target.text(strip=True)
+    return "".join(
+        node.text(deep=False, strip=True)
+        for node in target.traverse(include_text=True)
+        if node.tag == "-text" and node.parent.tag not in _NON_TEXT_TAGS
+    )
+
+
+def _node_text(target) -> str:
+    text = _lexbor_text(target) if LexborHTMLParser else target.get_text(strip=True)
+    return " ".join(text.split())
+
+
+@lru_cache(maxsize=256)
+def _compiled_selector(selector: str):
+    """Compile a CSS selector once for the bs4 path (selectors come from config)."""
+    return soupsieve.compile(selector)
+
+
+def _select_one(node, selector: str):
+    if LexborHTMLParser:
+        return node.css_first(selector)
+    return _compiled_selector(selector).select_one(node)
+
+
+def _select_firsts(node, selectors: Iterable[Optional[str]]) -> Dict[str, Any]:
+    """Map each selector to its first match under node (None if nothing matches).
+
+    On the bs4 path the subtree is walked once for all selectors instead of once
+    per select_one call. :scope selectors depend on the select root, so they (and
+    the selectolax path, already native) keep using per-selector lookups.
+    """
+    unique = {selector for selector in selectors if selector}
+    if LexborHTMLParser or any(":scope" in selector for selector in unique):
+        return {selector: _select_one(node, selector) for selector in unique}
+
+    found: Dict[str, Any] = dict.fromkeys(unique)
+    pending = {selector: _compiled_selector(selector) for selector in unique}
+    for element in node.descendants:
+        if not pending:
+            break
+        if not isinstance(element, Tag):
+            continue
+        for selector, compiled in list(pending.items()):
+            if compiled.match(element):
+                found[selector] = element
+                del pending[selector]
+    return found
+
+
+def _select_first_text(targets: Dict[str, Any], selector: Optional[str]) -> str:
+    target = targets.get(selector) if selector else None
     if not target:
         return ""
-    return " ".join(target.get_text(strip=True).split())
+    return _node_text(target)
 
 
-def _select_first_attr(node, selector: Optional[str], attr: Optional[str]) -> str:
-    if not selector:
-        return ""
-    target = node.select_one(selector)
+def _select_first_attr(targets: Dict[str, Any], selector: Optional[str], attr: Optional[str]) -> str:
+    target = targets.get(selector) if selector else None
     if not target:
         return ""
-    if attr:
-        return str(target.get(attr, "")).strip()
-    return str(target.get("href", "")).strip()
+    # Valueless attributes come back as None from selectolax and "" from bs4
+    value = (target.attributes if LexborHTMLParser else target).get(attr or "href")
+    return str(value or "").strip()
 
 
 def parse_list_page(html: str, list_item_selector: str):
-    soup = BeautifulSoup(html, "html.parser")
-    return soup.select(list_item_selector)
+    # selectolax (lexbor, C) parses far faster than bs4's pure-Python html.parser
+    if LexborHTMLParser:
+        return LexborHTMLParser(html).css(list_item_selector)
+    soup = BeautifulSoup(html, _BS4_FEATURES)
+    return _compiled_selector(list_item_selector).select(soup)
 
 
 def extract_job_fields(node, config, base_url: Optional[str]):
-    title = _select_first_text(node, config.title_selector)
-    company = _select_first_text(node, config.company_selector) if config.company_selector else ""
-    date_raw = _select_first_attr(node, config.date_selector, config.date_attr) if config.date_selector else ""
-    url_raw = _select_first_attr(node, config.url_selector, config.url_attr)
-    description = _select_first_text(node, config.description_selector) if config.description_selector else ""
-    location = _select_first_text(node, config.location_selector) if config.location_selector else ""
+    targets = _select_firsts(node, (
+        config.title_selector,
+        config.company_selector,
+        config.date_selector,
+        config.url_selector,
+        config.description_selector,
+        config.location_selector,
+    ))
+    title = _select_first_text(targets, config.title_selector)
+    company = _select_first_text(targets, config.company_selector)
+    date_raw = _select_first_attr(targets, config.date_selector, config.date_attr)
+    url_raw = _select_first_attr(targets, config.url_selector, config.url_attr)
+    description = _select_first_text(targets, config.description_selector)
+    location = _select_first_text(targets, config.location_selector)
 
     url = urljoin(base_url, url_raw) if base_url else url_raw
     return title, company, date_raw, url, description, location
@@ -46,8 +121,8 @@ def extract_job_fields(node, config, base_url: Optional[str]):
 def extract_detail_description(html: str, selector: Optional[str]) -> str:
     if not selector:
         return ""
-    soup = BeautifulSoup(html, "html.parser")
-    target = soup.select_one(selector)
+    root = LexborHTMLParser(html) if LexborHTMLParser else BeautifulSoup(html, _BS4_FEATURES)
+    target = _select_one(root, selector)
     if not target:
         return ""
-    return " ".join(target.get_text(strip=True).split())
+    return _node_text(target)
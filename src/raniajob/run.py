@@ -4,42 +4,82 @@ import argparse
 import re
 import sys
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List, Optional, Set, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from .config import AppConfig, load_config
 from .fetcher import Fetcher
-from .filters import exclude_keyword_match, filter_by_date, include_keyword_match, normalize_keywords, is_hourly_job, extract_state, extract_salary, count_keyword_matches
+from .filters import count_matches_lower, filter_jobs_by_date, matches_any_lower, normalize_keywords, is_hourly_job, extract_state, extract_salary
 from .location_filters import filter_jobs_by_location, get_default_target_states
 from .models import JobPosting
 from .parser import extract_detail_description
 from .sites.registry import get_parser
 from .storage import write_csv, write_json
-from .email_report import send_email_report
 
 
 def _dedupe(items: Iterable[JobPosting]) -> List[JobPosting]:
-    seen: Set[str] = set()
-    unique: List[JobPosting] = []
+    # Keep the posting with the longest description per URL (the first one on
+    # ties), so a later copy carrying detail-page text is not thrown away.
+    # Dicts preserve insertion order, so each URL keeps its first position.
+    unique: Dict[str, JobPosting] = {}
     for item in items:
-        if item.url in seen:
-            continue
-        seen.add(item.url)
-        unique.append(item)
-    return unique
+        kept = unique.get(item.url)
+        if kept is None or len(item.description or "") > len(kept.description or ""):
+            unique[item.url] = item
+    return list(unique.values())
 
 
 def _fetch_site(fetcher: Fetcher, config) -> List[str]:
-    pages: List[str] = []
-    for url in config.start_urls:
-        # Skip empty URLs (used by jobspy/workday/playwright sites)
-        if not url or not url.strip():
-            continue
-        html = fetcher.get(url)
-        if html:
-            pages.append(html)
-    return pages
+    # Skip empty URLs (used by jobspy/workday/playwright sites)
+    urls = [url for url in config.start_urls if url and url.strip()]
+    return [html for html in fetcher.get_many(urls) if html]
+
+
+def _collect_site(fetcher: Fetcher, site) -> List[JobPosting]:
+    parser = get_parser(site.type)
+    pages = _fetch_site(fetcher, site)
+
+    # Pass fetcher to JobSpy parser for HTML date extraction
+    if site.type == "jobspy":
+        parsed_items = parser(pages, site, site.base_url or "", site.name, fetcher)
+    else:
+        parsed_items = parser(pages, site, site.base_url or "", site.name)
+    if site.detail_page.enabled and site.detail_page.description_selector:
+        # Fetch all missing detail pages concurrently, then rebuild in order
+        missing_urls = list(dict.fromkeys(item.url for item in parsed_items if not item.description))
+        detail_pages = dict(zip(
+            missing_urls,
+            fetcher.get_many(missing_urls, max_workers=site.detail_page.concurrency),
+        ))
+        enriched_items: List[JobPosting] = []
+        for item in parsed_items:
+            if item.description:
+                enriched_items.append(item)
+                continue
+            detail_html = detail_pages[item.url]
+            detail_description = extract_detail_description(detail_html, site.detail_page.description_selector)
+            enriched_items.append(replace(item, description=detail_description))
+        parsed_items = enriched_items
+    return parsed_items
+
+
+def _matches_job(title_lower: str, description_lower: str, keywords: Iterable[str]) -> bool:
+    """Return True if any keyword occurs in the lowered title or the lowered description.
+
+    Each field is matched on its own, so a keyword split across the end of the
+    title and the start of the description ("... Cell" + "Therapy ...") does not match.
+    """
+    return matches_any_lower(title_lower, keywords) or matches_any_lower(description_lower, keywords)
+
+
+def _count_job_matches(title_lower: str, description_lower: str, keywords: Iterable[str]) -> int:
+    """Count keywords found in the lowered title or description (per field, like _matches_job)."""
+    return count_matches_lower((title_lower, description_lower), keywords)
 
 
 def _apply_filters(
@@ -50,9 +90,14 @@ def _apply_filters(
     title_must_contain: List[str],
     title_exclude: List[str],
     days_back: int,
-) -> List[JobPosting]:
+) -> List[Tuple[JobPosting, int]]:
+    """Return (job, job_titles match count) for every job that passes the filters.
+
+    The count is taken on the lowered fields already at hand, per field like the
+    keyword filters, so the super filter does not rescan descriptions.
+    """
     now = datetime.now(timezone.utc)
-    filtered: List[JobPosting] = []
+    filtered: List[Tuple[JobPosting, int]] = []
 
     # Debugging counters
     filter_stats = {
@@ -67,50 +112,52 @@ def _apply_filters(
         'passed_all_filters': 0
     }
 
-    for item in items:
-        filter_stats['total_input'] += 1
+    # Date filtering (batched: cutoff computed once)
+    items = list(items)
+    dated = filter_jobs_by_date(items, days_back, now=now)
+    filter_stats['total_input'] = len(items)
+    filter_stats['date_filtered'] = len(items) - len(dated)
 
-        # Date filtering
-        if not filter_by_date(item.date_posted, days_back, now=now):
-            filter_stats['date_filtered'] += 1
-            continue
-
-        # Combined text for filtering (title + description)
-        combined_text = f"{item.title} {item.description}"
+    for item in dated:
+        # Lowercase title and description once per item; they are scanned
+        # separately so the description is never copied into a combined string
+        title_lower = item.title.lower()
+        description_lower = item.description.lower()
 
         # Job title filtering (only if job_titles is not empty)
         # Checks BOTH title AND description for any matching job title keyword
-        if job_titles and not include_keyword_match(combined_text, job_titles):
+        if job_titles and not _matches_job(title_lower, description_lower, job_titles):
             filter_stats['job_title_filtered'] += 1
             continue
 
         # Title must contain filtering - checks TITLE ONLY for required words
-        if title_must_contain and not include_keyword_match(item.title, title_must_contain):
+        if title_must_contain and not matches_any_lower(title_lower, title_must_contain):
             filter_stats['title_must_contain_filtered'] += 1
             continue
 
         # Title exclude filtering - reject if title contains any excluded word
-        if title_exclude and not exclude_keyword_match(item.title, title_exclude):
+        if title_exclude and matches_any_lower(title_lower, title_exclude):
             filter_stats['title_exclude_filtered'] += 1
             continue
 
         # Include keyword filtering
-        if not include_keyword_match(combined_text, include_keywords):
+        if include_keywords and not _matches_job(title_lower, description_lower, include_keywords):
             filter_stats['include_keyword_filtered'] += 1
             continue
 
         # Exclude keyword filtering
-        if not exclude_keyword_match(combined_text, exclude_keywords):
+        if exclude_keywords and _matches_job(title_lower, description_lower, exclude_keywords):
             filter_stats['exclude_keyword_filtered'] += 1
             continue
 
         # Hourly job filtering - exclude jobs that pay per hour
-        if is_hourly_job(combined_text):
+        if is_hourly_job(title_lower) or is_hourly_job(description_lower):
             filter_stats['hourly_filtered'] += 1
             continue
 
         filter_stats['passed_all_filters'] += 1
-        filtered.append(item)
+        title_matches = _count_job_matches(title_lower, description_lower, job_titles)
+        filtered.append((item, title_matches))
 
     # Log comprehensive filtering statistics
     print("\nFILTER STATISTICS:", file=sys.stderr)
@@ -126,12 +173,14 @@ def _apply_filters(
     return filtered
 
 
-def _get_date_priority(date_posted: Optional[datetime], now: datetime) -> int:
-    """Return sort priority: 0=today, 1=yesterday, 2=2days ago, 3=N/A, 4+=older"""
+def _get_date_priority(date_posted: Optional[datetime], today: datetime) -> int:
+    """Return sort priority: 0=today, 1=yesterday, 2=2days ago, 3=N/A, 4+=older
+
+    today is the current time truncated to midnight, computed once by the caller.
+    """
     if date_posted is None:
         return 3  # N/A after 2 days ago, before older
 
-    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
     post_date = date_posted.replace(hour=0, minute=0, second=0, microsecond=0)
     days_diff = (today - post_date).days
 
@@ -145,10 +194,16 @@ def _get_date_priority(date_posted: Optional[datetime], now: datetime) -> int:
         return 3 + days_diff  # Older dates: 4, 5, 6...
 
 
+_STATE_ORDER = {'NY': 0, 'NJ': 1, 'PA': 2, 'MA': 3, 'CA': 4}
+
+
 def _get_state_priority(state: Optional[str]) -> int:
     """Return state priority: NY=0, NJ=1, PA=2, MA=3, CA=4, other=5"""
-    state_order = {'NY': 0, 'NJ': 1, 'PA': 2, 'MA': 3, 'CA': 4}
-    return state_order.get(state.upper(), 5) if state else 5
+    return _STATE_ORDER.get(state.upper(), 5) if state else 5
+
+
+_SALARY_VALUE_RE = re.compile(r'\$?([\d,]+(?:\.\d+)?)\s*(?P<k>[kK])?')
+_SALARY_K_RE = re.compile(r'[\d,]+(?:\.\d+)?\s*[kK]')
 
 
 def _parse_salary_value(salary: Optional[str]) -> Optional[float]:
@@ -163,15 +218,16 @@ def _parse_salary_value(salary: Optional[str]) -> Optional[float]:
         return None
 
     # Find first number with optional K suffix
-    match = re.search(r'\$?([\d,]+(?:\.\d+)?)\s*[kK]?', salary)
+    match = _SALARY_VALUE_RE.search(salary)
     if not match:
         return None
 
     num_str = match.group(1).replace(',', '')
     try:
         value = float(num_str)
-        # Check if K suffix follows
-        if re.search(r'[\d,]+(?:\.\d+)?\s*[kK]', salary):
+        # A K on any number scales the first one ("$120-150K"); nothing numeric
+        # precedes the first match, so scanning from there is enough
+        if match.group('k') or _SALARY_K_RE.search(salary, match.start()):
             value *= 1000
         return value
     except ValueError:
@@ -197,50 +253,45 @@ def _get_salary_priority(salary: Optional[str]) -> Tuple[int, float]:
 
 def _sort_items(items: Iterable[JobPosting]) -> List[JobPosting]:
     """Sort by date priority, then state priority, then salary priority."""
-    now = datetime.now(timezone.utc)
+    today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
     return sorted(items, key=lambda item: (
-        _get_date_priority(item.date_posted, now),
+        _get_date_priority(item.date_posted, today),
         _get_state_priority(item.state),
         _get_salary_priority(item.salary)
     ))
 
 
+def _sort_items_by_date(items: Iterable[JobPosting]) -> List[JobPosting]:
+    """Sort by date priority only; a cheap order for the large unfiltered set."""
+    today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    return sorted(items, key=lambda item: _get_date_priority(item.date_posted, today))
+
+
 def _enrich_jobs(items: Iterable[JobPosting]) -> List[JobPosting]:
     """Enrich jobs with state and salary information."""
     enriched: List[JobPosting] = []
     for item in items:
         state = extract_state(item.location)
         salary = extract_salary(item.description)
-        enriched.append(
-            JobPosting(
-                title=item.title,
-                company=item.company,
-                url=item.url,
-                description=item.description,
-                date_posted=item.date_posted,
-                source=item.source,
-                location=item.location,
-                state=state,
-                salary=salary,
-                expiration_date=item.expiration_date,
-            )
-        )
+        enriched.append(replace(item, state=state, salary=salary))
     return enriched
 
 
-def _count_by_domain(items: List[JobPosting]) -> dict:
+# Authority part of "scheme://host/..." or "//host/...", as urlsplit reads it
+_NETLOC_RE = re.compile(r'(?:[A-Za-z][A-Za-z0-9+.\-]*:)?//([^/?#]*)')
+
+
+@lru_cache(maxsize=100_000)
+def _extract_domain(url: str) -> str:
+    """Return the URL's host without a leading 'www.' (memoized per URL)."""
+    # Only the netloc is needed, so skip building a full urlsplit() result
+    match = _NETLOC_RE.match(url.lstrip())
+    return (match.group(1).removeprefix("www.") if match else "") or "unknown"
+
+
+def _count_by_domain(items: List[JobPosting]) -> Counter:
     """Count jobs by URL domain."""
-    from urllib.parse import urlparse
-    counts: dict = {}
-    for item in items:
-        try:
-            domain = urlparse(item.url).netloc or "unknown"
-            if domain.startswith("www."):
-                domain = domain[4:]
-        except Exception:
-            domain = "unknown"
-        counts[domain] = counts.get(domain, 0) + 1
-    return counts
+    return Counter(_extract_domain(item.url) for item in items)
 
 
 def _print_stats_report(unfiltered: List[JobPosting], filtered: List[JobPosting], unfiltered_path: str, filtered_path: str) -> None:
@@ -255,13 +306,13 @@ def _print_stats_report(unfiltered: List[JobPosting], filtered: List[JobPosting]
     print(f"\nUNFILTERED RESULTS: {len(unfiltered)} total jobs", file=sys.stderr)
     print(f"  File: {unfiltered_path}", file=sys.stderr)
     print("  By domain:", file=sys.stderr)
-    for domain, count in sorted(unfiltered_by_domain.items(), key=lambda x: -x[1]):
+    for domain, count in unfiltered_by_domain.most_common():
         print(f"    - {domain}: {count} jobs", file=sys.stderr)
 
     print(f"\nFILTERED RESULTS: {len(filtered)} total jobs", file=sys.stderr)
     print(f"  File: {filtered_path}", file=sys.stderr)
     print("  By domain:", file=sys.stderr)
-    for domain, count in sorted(filtered_by_domain.items(), key=lambda x: -x[1]):
+    for domain, count in filtered_by_domain.most_common():
         print(f"    - {domain}: {count} jobs", file=sys.stderr)
 
     print("\n" + "=" * 60, file=sys.stderr)
@@ -290,7 +341,7 @@ def _generate_output_paths(base_name: str, output_format: str) -> tuple:
     return str(filtered_path), str(unfiltered_path), str(super_filtered_path)
 
 
-def run_pipeline(config: AppConfig, output_base_name: str, output_format: str, extra_keywords: List[str], send_email: bool = False) -> List[JobPosting]:
+def run_pipeline(config: AppConfig, output_base_name: str, output_format: str, extra_keywords: List[str], send_email: bool = False, sort_unfiltered: bool = False) -> List[JobPosting]:
     start_time = time.time()
 
     include_keywords = normalize_keywords(config.include_keywords + extra_keywords)
@@ -302,54 +353,30 @@ def run_pipeline(config: AppConfig, output_base_name: str, output_format: str, e
         sleep_seconds=config.fetcher.sleep_seconds,
         timeout=config.fetcher.timeout,
         rotate_user_agents=config.fetcher.rotate_user_agents,
-        use_cloudscraper=config.fetcher.use_cloudscraper
+        use_cloudscraper=config.fetcher.use_cloudscraper,
+        use_http2=config.fetcher.use_http2,
     )
 
+    # Sites run in parallel only when fetcher.site_concurrency > 1 (opt-in):
+    # Fetcher.get serializes same-host requests, but JobSpy's scrape_jobs calls
+    # bypass the fetcher and a cloudscraper session is not thread-safe.
+    # map() returns results in config order so dedupe ties resolve the same way.
+    enabled_sites = [site for site in config.sites if site.enabled]
     all_items: List[JobPosting] = []
-    for site in config.sites:
-        if not site.enabled:
-            continue
-        parser = get_parser(site.type)
-        pages = _fetch_site(fetcher, site)
-
-        # Pass fetcher to JobSpy parser for HTML date extraction
-        if site.type == "jobspy":
-            parsed_items = parser(pages, site, site.base_url or "", site.name, fetcher)
-        else:
-            parsed_items = parser(pages, site, site.base_url or "", site.name)
-        if site.detail_page.enabled and site.detail_page.description_selector:
-            enriched_items: List[JobPosting] = []
-            for item in parsed_items:
-                if item.description:
-                    enriched_items.append(item)
-                    continue
-                detail_html = fetcher.get(item.url)
-                detail_description = extract_detail_description(detail_html, site.detail_page.description_selector)
-                enriched_items.append(
-                    JobPosting(
-                        title=item.title,
-                        company=item.company,
-                        url=item.url,
-                        description=detail_description,
-                        date_posted=item.date_posted,
-                        source=item.source,
-                        location=item.location,
-                        expiration_date=item.expiration_date,
-                    )
-                )
-            parsed_items = enriched_items
-        all_items.extend(parsed_items)
-
-    deduped = _dedupe(all_items)
-
-    # Enrich jobs with state and salary information
-    enriched = _enrich_jobs(deduped)
+    if enabled_sites:
+        with ThreadPoolExecutor(max_workers=min(config.fetcher.site_concurrency, len(enabled_sites))) as executor:
+            for parsed_items in executor.map(lambda site: _collect_site(fetcher, site), enabled_sites):
+                all_items.extend(parsed_items)
+
+    # Dedupe, then enrich jobs with state and salary information
+    enriched = _enrich_jobs(_dedupe(all_items))
 
     # Generate output paths with timestamps
     filtered_path, unfiltered_path, super_filtered_path = _generate_output_paths(output_base_name, output_format)
 
-    # Write unfiltered results (all enriched items, sorted by date)
-    unfiltered_sorted = _sort_items(enriched)
+    # Write unfiltered results (all enriched items, sorted by date). The full
+    # state/salary ordering is only computed for this set when asked for.
+    unfiltered_sorted = _sort_items(enriched) if sort_unfiltered else _sort_items_by_date(enriched)
     if output_format == "json":
         write_json(unfiltered_path, unfiltered_sorted)
     elif output_format == "csv":
@@ -362,8 +389,8 @@ def run_pipeline(config: AppConfig, output_base_name: str, output_format: str, e
     print(f"Location filtering: kept {len(location_filtered)}/{len(enriched)} jobs from target states (NY, NJ, PA, MA, CA)", file=sys.stderr)
 
     # Apply other filters (keywords, dates, etc.)
-    filtered = _apply_filters(location_filtered, include_keywords, exclude_keywords, job_titles, title_must_contain, title_exclude, config.schedule.days_back)
-    ordered = _sort_items(filtered)
+    filtered_counts = _apply_filters(location_filtered, include_keywords, exclude_keywords, job_titles, title_must_contain, title_exclude, config.schedule.days_back)
+    ordered = _sort_items(item for item, _ in filtered_counts)
 
     # Write filtered results
     if output_format == "json":
@@ -377,11 +404,9 @@ def run_pipeline(config: AppConfig, output_base_name: str, output_format: str, e
 
     # Create super-filtered output (jobs with 2+ keyword matches)
     # Use job_titles for super-filtering (include_keywords is often empty)
-    super_filtered = [
-        item for item in ordered
-        if count_keyword_matches(f"{item.title} {item.description}", job_titles) >= 2
-    ]
-    super_ordered = _sort_items(super_filtered)
+    # Filtering a sorted list keeps it sorted, so no second sort is needed
+    super_ids = {id(item) for item, title_matches in filtered_counts if title_matches >= 2}
+    super_ordered = [item for item in ordered if id(item) in super_ids]
     if output_format == "json":
         write_json(super_filtered_path, super_ordered)
     elif output_format == "csv":
@@ -393,6 +418,8 @@ def run_pipeline(config: AppConfig, output_base_name: str, output_format: str, e
 
     # Send email report if requested
     if send_email:
+        # Imported lazily: SMTP/MIME modules are only needed for --email runs
+        from .email_report import send_email_report
         send_email_report(unfiltered_sorted, ordered, unfiltered_path, filtered_path, super_filtered=super_ordered)
 
     # Print total run time
@@ -409,11 +436,12 @@ def main() -> int:
     parser.add_argument("--format", choices=["json", "csv"], default="json", help="Output format.")
     parser.add_argument("--keyword", action="append", default=[], help="Extra keyword to filter on.")
     parser.add_argument("--email", action="store_true", help="Send email report after scraping. Requires GMAIL_ADDRESS, GMAIL_APP_PASSWORD, and REPORT_RECIPIENT environment variables.")
+    parser.add_argument("--sort-unfiltered", action="store_true", help="Also order the unfiltered output by state and salary within each date bucket (it is ordered by date only by default).")
 
     args = parser.parse_args()
 
     app_config = load_config(args.config)
-    run_pipeline(app_config, args.output, args.format, args.keyword, send_email=args.email)
+    run_pipeline(app_config, args.output, args.format, args.keyword, send_email=args.email, sort_unfiltered=args.sort_unfiltered)
     return 0
 
 
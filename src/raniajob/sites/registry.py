@@ -1,22 +1,21 @@
 from __future__ import annotations
 
-from typing import Callable, Dict
+from importlib import import_module
+from typing import Callable, Dict, Tuple
 
-from .generic import parse_generic_site
-from .jobspy import parse_jobspy_sites
-from .workday import parse_workday_site
-from .playwright_scraper import parse_playwright_site
 
-
-PARSERS: Dict[str, Callable] = {
-    "generic": parse_generic_site,
-    "jobspy": parse_jobspy_sites,
-    "workday": parse_workday_site,
-    "playwright": parse_playwright_site,
+# Parser modules are imported on first use so that heavy optional dependencies
+# (pandas/JobSpy, Playwright) are only loaded when a site of that type runs.
+_PARSER_PATHS: Dict[str, Tuple[str, str]] = {  # site type -> (module, function)
+    "generic": (".generic", "parse_generic_site"),
+    "jobspy": (".jobspy", "parse_jobspy_sites"),
+    "workday": (".workday", "parse_workday_site"),
+    "playwright": (".playwright_scraper", "parse_playwright_site"),
 }
 
 
 def get_parser(site_type: str) -> Callable:
-    if site_type not in PARSERS:
+    if site_type not in _PARSER_PATHS:
         raise ValueError(f"Unsupported site type: {site_type}")
-    return PARSERS[site_type]
+    module_name, func_name = _PARSER_PATHS[site_type]
+    return getattr(import_module(module_name, __package__), func_name)